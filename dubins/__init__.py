@@ -6,8 +6,10 @@ Requirements: Python 3.11, matplotlib.
 Download: https://github.com/mnichol3/dubins
 """
 from ._dubins_base import DubinsType, Turn
+from .batch import create_paths_batch
 from .dubins_csc import DubinsCSC
 from .dubins_loopback import DubinsLoopback
+from .path import PathArray
 from .point import Waypoint
 from .planner import create_path, get_dubins
 from .plotting import plot_path
@@ -16,9 +18,11 @@ __all__ = [
     "DubinsLoopback",
     "DubinsCSC",
     "DubinsType",
+    "PathArray",
     "Turn",
     "Waypoint",
     "create_path",
+    "create_paths_batch",
     "get_dubins",
     "plot_path",
 ]
@@ -1,11 +1,15 @@
 """This module contains the base class for creating Dubins paths."""
 from __future__ import annotations
 from enum import Enum
-from math import pi
+from math import ceil, pi
 from typing import TypeAlias
 
-from .point import Circle, IntermediatePoint, Waypoint
-from .mathlib import cos, sin, normalize_angle
+import numpy as np
+
+from ._kernels import arc_points, line_points
+from .path import PathArray
+from .point import Circle, Waypoint
+from .mathlib import normalize_angle
 
 
 Point: TypeAlias = tuple[float, float]
@@ -45,21 +49,10 @@ class DubinsType(Enum):
         ValueError
             If an invalid combination of turns are passed in the `turns` param.
         """
-        ttype = None
-        t1, t2 = turns
-
-        if t1 == t2 == Turn.RIGHT:
-            ttype = cls.RSR
-        elif t1 == t2 == Turn.LEFT:
-            ttype = cls.LSL
-        elif t1 == Turn.RIGHT and t2 == Turn.LEFT:
-            ttype = cls.RSL
-        elif t1 == Turn.LEFT and t2 == Turn.RIGHT:
-            ttype = cls.LSR
-        else:
-            raise ValueError(f'Invalid turn combination: {turns}')
-
-        return ttype
+        try:
+            return _TURNS_TO_TYPE[tuple(turns)]
+        except KeyError:
+            raise ValueError(f'Invalid turn combination: {turns}') from None
 
 
 class Turn(Enum):
@@ -67,6 +60,10 @@ class Turn(Enum):
     LEFT = -1
     RIGHT = 1
 
+    def __neg__(self) -> Turn:
+        """Return the Turn in the opposite direction."""
+        return _TURN_NEGATE[self]
+
     @classmethod
     def reverse(cls, turn: Turn) -> Turn:
         """Return a new Turn in the direction opposite of the given Turn."""
@@ -74,7 +71,27 @@ class Turn(Enum):
             raise TypeError(
                 f'turn parameter must be of type Turn, got {type(turn)}')
 
-        return Turn.RIGHT if turn == Turn.LEFT else Turn.LEFT
+        return -turn
+
+
+# Negation resolved by a single hash lookup rather than the Enum
+# value-to-member constructor call.
+_TURN_NEGATE = {Turn.LEFT: Turn.RIGHT, Turn.RIGHT: Turn.LEFT}
+
+
+# Single hash lookup for DubinsType.from_turns, replacing chained Enum
+# equality comparisons.
+_TURNS_TO_TYPE = {
+    (Turn.RIGHT, Turn.RIGHT): DubinsType.RSR,
+    (Turn.LEFT, Turn.LEFT): DubinsType.LSL,
+    (Turn.RIGHT, Turn.LEFT): DubinsType.RSL,
+    (Turn.LEFT, Turn.RIGHT): DubinsType.LSR,
+}
+
+# Cases whose tangent line connects the circle centers directly, shared
+# so membership checks hash against one constant instead of building a
+# list per call.
+_STRAIGHT_CASES = frozenset((DubinsType.LSL, DubinsType.RSR))
 
 
 class DubinsBase:
@@ -94,6 +111,10 @@ class DubinsBase:
         Circles defining the arcs to rotate about to create the path.
     """
 
+    # Class-level flag read by the planner in place of an isinstance
+    # check; subclasses override as appropriate.
+    _is_loopback = False
+
     def __init__(
         self,
         origin: Waypoint,
@@ -117,6 +138,12 @@ class DubinsBase:
         self.length = 0.
         self.d = 0.
         self.theta = 0.
+        # Invariant radius subexpressions reused across construction.
+        self._two_r = 2. * radius
+        self._four_r_sq = self._two_r * self._two_r
+        # Per-segment heading arrays, collected only while
+        # create_path_array() is sampling.
+        self._seg_psis = None
 
     @property
     def beta(self) -> float:
@@ -141,18 +168,105 @@ class DubinsBase:
         -------
         Circle
         """
+        # Read the raw int sign out of the Enum once; Circle.s and all
+        # downstream arithmetic stay plain ints.
+        s = turn.value
+
         return Circle(
-            point.x + (turn.value * self.radius * cos(point.crs_norm)),
-            point.y - (turn.value * self.radius * sin(point.crs_norm)),
-            turn.value,
+            point.x + (s * self.radius * point._cos_crs),
+            point.y - (s * self.radius * point._sin_crs),
+            s,
         )
 
+    def n_points(self, delta_psi: float = 1, delta_d: float = 1) -> int:
+        """Return an upper bound on the number of points create_path()
+        will emit.
+
+        Used to preallocate the output buffer in one shot; each arc is
+        bounded by a full revolution of samples and the straight segment
+        by its length (or, for paths that close on the terminus, the
+        origin-terminus distance plus two diameters).
+
+        Parameters
+        ----------
+        delta_psi: float, optional
+            Interval at which arc points are computed, in degrees.
+            Default is 1.
+        delta_d: float, optional
+            Interval at which straight-segment points are computed,
+            unitless. Default is 1.
+
+        Returns
+        -------
+        int
+        """
+        arcs = 2 * (ceil(360. / delta_psi) + 2)
+        line = max(
+            self.d, self.origin.distance_to(self.terminus) + 2. * self._two_r)
+
+        return arcs + ceil(line / delta_d) + 2
+
+    def create_path_tuples(self, **kwargs) -> list[Point]:
+        """Construct the path and return it as a list of (x, y) tuples.
+
+        Backwards-compatible wrapper around create_path() for callers
+        that expect Python tuples rather than a NumPy array.
+
+        Parameters
+        ----------
+        kwargs: optional
+            Keyword arguments to pass to create_path().
+
+        Returns
+        -------
+        list of tuple[float, float]
+        """
+        return [tuple(point) for point in self.create_path(**kwargs).tolist()]
+
+    def create_path_array(self, **kwargs) -> PathArray:
+        """Construct the path as a PathArray carrying per-point headings.
+
+        Samples the same points as create_path() but also collects the
+        heading at each sample, returning both as parallel arrays.
+        IntermediatePoint objects can be materialized from the result on
+        demand via PathArray.to_intermediate_points().
+
+        Parameters
+        ----------
+        kwargs: optional
+            Keyword arguments to pass to create_path().
+
+        Returns
+        -------
+        PathArray
+        """
+        self._seg_psis = []
+
+        try:
+            points = self.create_path(**kwargs)
+
+            if self._seg_psis:
+                psis = np.concatenate(self._seg_psis)
+            else:
+                psis = np.empty(0)
+
+            # create_path inserts the origin itself when the first arc
+            # is empty; mirror that in the heading array.
+            if len(psis) == len(points) - 1:
+                psis = np.concatenate(([self.origin.crs_norm], psis))
+        finally:
+            self._seg_psis = None
+
+        return PathArray(points, psis)
+
     def _calc_arc_points(
         self,
         circle: Circle,
         psi_f: float,
         delta_psi: float,
-    ) -> list[IntermediatePoint]:
+        dtype: np.dtype = np.float64,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
         """Compute the points along an arc defined by a circle.
 
         Parameters
@@ -163,63 +277,61 @@ class DubinsBase:
             Final heading.
         delta_psi: float
             Interval at which to compute arc points, in degrees.
+        dtype: np.dtype, optional
+            Dtype of the output point array. Default is np.float64.
+        out: ndarray, optional
+            Buffer to write the points into; see _kernels.arc_points.
 
         Returns
         -------
-        list of IntermediatePoint
+        ndarray
+            (n, 2) array of point coordinates.
         """
-        waypoints = []
-        psi_f = round(psi_f, 2)
-        theta = 0
-
-        while abs(self.psi - psi_f) > delta_psi:
-            curr_point = IntermediatePoint(
-                circle.x - (circle.s * self.radius * sin(90 - self.psi)),
-                circle.y + (circle.s * self.radius * cos(90 - self.psi)),
-                self.psi,
-                (pi * self.radius * delta_psi) / 180.,
-            )
-            waypoints.append(curr_point)
+        points, psis, self.psi = arc_points(
+            circle.x, circle.y, circle.s, self.radius, self.psi, psi_f,
+            delta_psi, dtype=dtype, out=out)
 
-            self.psi = normalize_angle(self.psi + delta_psi * circle.s)
-            theta += delta_psi
+        if self._seg_psis is not None:
+            self._seg_psis.append(psis)
 
-        self.length += (pi * self.radius * theta) / 180.
+        self.length += (pi * self.radius * (len(points) * delta_psi)) / 180.
 
-        return waypoints
+        return points
 
     def _calc_line_points(
         self,
-        origin: IntermediatePoint,
+        origin: Point,
         delta: float,
-    ) -> list[IntermediatePoint]:
+        dtype: np.dtype = np.float64,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
         """Compute points along the tangent line connecting the two arcs.
 
         Parameters
         ----------
-        origin: IntermediatePoint
+        origin: tuple of float, float
             origin x- and y-coordinate.
         delta: float
             Distance delta.
+        dtype: np.dtype, optional
+            Dtype of the output point array. Default is np.float64.
+        out: ndarray, optional
+            Buffer to write the points into; see _kernels.line_points.
 
         Returns
         -------
-        list of IntermediatePoint
+        ndarray
+            (n, 2) array of point coordinates.
         """
-        waypoints = []
-        d_sum = 0
-        x_p, y_p = origin.xy
-        d_max = self.d - delta # prevent overrun
+        x_p, y_p = origin
 
-        while d_sum < d_max:
-            x_n = x_p + delta * sin(self.theta)
-            y_n = y_p + delta * cos(self.theta)
-            waypoints.append(IntermediatePoint(x_n, y_n, self.psi, delta))
+        points = line_points(
+            x_p, y_p, self.theta, delta, self.d, dtype=dtype, out=out)
 
-            x_p = x_n
-            y_p = y_n
-            d_sum += delta
+        if self._seg_psis is not None:
+            self._seg_psis.append(
+                np.full(len(points), normalize_angle(self.theta)))
 
-        self.length += d_sum
+        self.length += len(points) * delta
 
-        return waypoints
+        return points
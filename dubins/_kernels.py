@@ -0,0 +1,228 @@
+"""This module contains the numeric kernels used to sample Dubins paths.
+
+The kernels are module-level functions of scalars and ndarrays only (no
+package classes), so a JIT compiler such as numba could be applied to
+them without modification if one is ever added as a dependency.
+"""
+from math import ceil, cos, sin
+
+import numpy as np
+
+from .mathlib import _DEG2RAD, normalize_angle
+
+
+# Cached sin/cos tables of the arc-step offsets k * step_rad, keyed by the
+# signed step. delta_psi is fixed within a call and almost always shared
+# across calls, so the tables are computed once and reused.
+_STEP_TABLES: dict[float, tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _step_tables(step_rad: float, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return (sin, cos) tables of k * step_rad for k in [0, n).
+
+    Parameters
+    ----------
+    step_rad: float
+        Signed step between consecutive samples, in radians.
+    n: int
+        Number of entries required.
+
+    Returns
+    -------
+    tuple of (ndarray, ndarray)
+        Views of the cached sine and cosine tables.
+    """
+    tables = _STEP_TABLES.get(step_rad)
+
+    if tables is None or tables[0].size < n:
+        k = np.arange(max(n, 64)) * step_rad
+        tables = (np.sin(k), np.cos(k))
+        _STEP_TABLES[step_rad] = tables
+
+    return tables[0][:n], tables[1][:n]
+
+
+def normalize_angles(vals: np.ndarray) -> np.ndarray:
+    """Normalize an array of angles to (-180, 180].
+
+    Array counterpart of mathlib.normalize_angle, including the fold of
+    the -180 endpoint onto +180.
+
+    Parameters
+    ----------
+    vals: ndarray
+        Angles, in degrees.
+
+    Returns
+    -------
+    ndarray
+        Normalized angles.
+    """
+    norm = np.mod(vals + 180., 360.) - 180.
+    norm[norm == -180.] = 180.
+
+    return norm
+
+
+def arc_points(
+    cx: float,
+    cy: float,
+    s: int,
+    radius: float,
+    psi0: float,
+    psi_f: float,
+    delta_psi: float,
+    dtype: np.dtype = np.float64,
+    out: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """Sample the points along an arc.
+
+    Parameters
+    ----------
+    cx, cy: float
+        X- and y-coordinates of the center of the circle defining the arc.
+    s: int
+        Direction of rotation about the circle.
+        1 for clockwise, -1 for counter-clockwise.
+    radius: float
+        Turn radius, unitless.
+    psi0: float
+        Initial heading, in degrees (-180, 180].
+    psi_f: float
+        Final heading, in degrees (-180, 180].
+    delta_psi: float
+        Interval at which to compute arc points, in degrees.
+    dtype: np.dtype, optional
+        Dtype of the output point buffer. Default is np.float64;
+        np.float32 halves the buffer's memory footprint at the cost of
+        sub-millimeter positional error.
+    out: ndarray, optional
+        (m, 2) buffer to write the points into, amortizing allocations
+        across repeated calls. Used when m >= n, in which case a view of
+        its first n rows is returned; ignored (and a new buffer
+        allocated) otherwise.
+
+    Returns
+    -------
+    tuple of (ndarray, ndarray, float)
+        (n, 2) array of point coordinates, (n,) array of headings, and
+        the heading after the final sample.
+    """
+    psi_f = round(psi_f, 2)
+
+    # Total sweep from the initial heading to psi_f, measured in the
+    # direction of rotation, giving a closed-form sample count.
+    sweep = (s * (psi_f - psi0)) % 360.
+
+    if sweep >= 360. - delta_psi:
+        n = 0
+    else:
+        n = max(0, ceil(sweep / delta_psi - 1e-9) - 1)
+
+    # Headings are normalized to (-180, 180], so a target near +180
+    # approached from below is only "reached" once the heading crosses
+    # the branch cut; nudge the sample count forward to cover that case.
+    psi_end = psi0 + n * delta_psi * s
+    while (abs(normalize_angle(psi_end) - psi_f) > delta_psi
+            and n * delta_psi <= 360.):
+        n += 1
+        psi_end += delta_psi * s
+
+    psis = normalize_angles(psi0 + np.arange(n) * (delta_psi * s))
+
+    # The sample angles form the arithmetic sequence a0 - k*step, so the
+    # per-sample trig reduces to the angle-addition identity applied to
+    # the cached step tables; only a0 needs a fresh sin/cos evaluation.
+    # Degrees are converted to radians exactly once here, at the kernel
+    # boundary -- headings stay in degrees everywhere else so the public
+    # API is unaffected.
+    a0 = (90. - psi0) * _DEG2RAD
+    sin_0, cos_0 = sin(a0), cos(a0)
+    sin_k, cos_k = _step_tables(delta_psi * s * _DEG2RAD, n)
+
+    sr = s * radius
+
+    if out is not None and len(out) >= n:
+        points = out[:n]
+    else:
+        points = np.empty((n, 2), dtype=dtype)
+
+    # Write the angle-addition expansions directly into the output
+    # columns, using the y column as scratch for the x computation so a
+    # single extra temporary suffices (instead of one per operation).
+    x, y = points[:, 0], points[:, 1]
+
+    np.multiply(cos_k, sin_0, out=x)
+    np.multiply(sin_k, cos_0, out=y)
+    np.subtract(x, y, out=x)
+    np.multiply(x, -sr, out=x)
+    np.add(x, cx, out=x)
+
+    tmp = np.multiply(sin_k, sin_0)
+    np.multiply(cos_k, cos_0, out=y)
+    np.add(y, tmp, out=y)
+    np.multiply(y, sr, out=y)
+    np.add(y, cy, out=y)
+
+    return points, psis, normalize_angle(psi_end)
+
+
+def line_points(
+    x0: float,
+    y0: float,
+    theta: float,
+    delta: float,
+    d: float,
+    dtype: np.dtype = np.float64,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Sample the points along a line segment.
+
+    Parameters
+    ----------
+    x0, y0: float
+        X- and y-coordinates of the start of the segment. Not included
+        in the output.
+    theta: float
+        Heading of the segment, in degrees.
+    delta: float
+        Interval at which to compute points, unitless.
+    d: float
+        Length of the segment, unitless.
+    dtype: np.dtype, optional
+        Dtype of the output point buffer. Default is np.float64.
+    out: ndarray, optional
+        (m, 2) buffer to write the points into, amortizing allocations
+        across repeated calls. Used when m >= n, in which case a view of
+        its first n rows is returned; ignored (and a new buffer
+        allocated) otherwise.
+
+    Returns
+    -------
+    ndarray
+        (n, 2) array of point coordinates.
+    """
+    # Stop one sample short of d to prevent overrun.
+    n = max(0, ceil((d - delta) / delta - 1e-9))
+
+    theta_rad = theta * _DEG2RAD
+    dx = delta * sin(theta_rad)
+    dy = delta * cos(theta_rad)
+
+    k = np.arange(1, n + 1)
+
+    if out is not None and len(out) >= n:
+        points = out[:n]
+    else:
+        points = np.empty((n, 2), dtype=dtype)
+
+    # Multiply-add written into the output columns directly to avoid
+    # intermediate arrays.
+    x, y = points[:, 0], points[:, 1]
+
+    np.multiply(k, dx, out=x)
+    np.add(x, x0, out=x)
+    np.multiply(k, dy, out=y)
+    np.add(y, y0, out=y)
+
+    return points
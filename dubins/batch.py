@@ -0,0 +1,227 @@
+"""This module contains a vectorized batch interface for creating many
+Curve-Straight-Curve Dubins paths at once.
+
+The per-path construction parameters (circle centers, tangent line
+length, and tangent line heading) are computed for the whole batch with
+NumPy array arithmetic, amortizing the interpreter and libm overhead of
+DubinsCSC.__init__ across the batch. Each path is then sampled with the
+same kernels used by DubinsCSC.create_path.
+
+The batch computation is expressed purely in ufunc arithmetic over the
+batch dimension, so it could be dispatched to a GPU array module (e.g.
+CuPy) without restructuring should fleet-scale planning ever call for
+it; GPU libraries are deliberately not part of this package's
+dependencies.
+"""
+import numpy as np
+
+from ._dubins_base import DubinsType, Turn, _STRAIGHT_CASES
+from ._kernels import arc_points, line_points, normalize_angles
+from .mathlib import calc_azimuth_batch
+
+
+def create_paths_batch(
+    origins: np.ndarray,
+    termini: np.ndarray,
+    radius: float,
+    turns: list[Turn],
+    delta_psi: float = 1,
+    delta_d: float = 1,
+    dtype: np.dtype = np.float64,
+) -> list[np.ndarray]:
+    """Create a batch of Curve-Straight-Curve Dubins paths.
+
+    All paths share the same turn radius and turn combination. Every
+    origin/terminus pair must admit a CSC path; pairs requiring a
+    loopback path (cross-track distance smaller than the turn diameter)
+    are not supported by the vectorized construction.
+
+    Parameters
+    ----------
+    origins: ndarray
+        (n, 3) array of path origins as (x, y, crs) rows.
+    termini: ndarray
+        (n, 3) array of path termini as (x, y, crs) rows.
+    radius: float
+        Turn radius, unitless.
+    turns: list[Turn]
+        Turns to execute. Must have a length of 2.
+    delta_psi: float, optional
+        Interval at which to compute arc points, in degrees. Default is 1.
+    delta_d: float, optional
+        Interval at which to compute tangent line points, unitless.
+        Default is 1.
+    dtype: np.dtype, optional
+        Dtype of the output point arrays. Default is np.float64;
+        np.float32 halves the memory footprint at the cost of
+        sub-millimeter positional error.
+
+    Returns
+    -------
+    list of ndarray
+        One (n_i, 2) array of point coordinates per origin/terminus pair.
+
+    Raises
+    ------
+    ValueError
+        If the input arrays are not (n, 3) with matching lengths, or if
+        the turn radius is too large for any origin/terminus pair.
+    """
+    origins = np.asarray(origins, dtype=np.float64)
+    termini = np.asarray(termini, dtype=np.float64)
+
+    if (origins.ndim != 2 or origins.shape[1] != 3
+            or origins.shape != termini.shape):
+        raise ValueError(
+            'origins and termini must be (n, 3) arrays of (x, y, crs) rows,'
+            f' got {origins.shape} and {termini.shape}')
+
+    case = DubinsType.from_turns(turns)
+    params = _calc_batch_params(origins, termini, radius, turns, case)
+
+    return [
+        _sample_csc(*param_row, radius, delta_psi, delta_d, dtype)
+        for param_row in zip(*params)]
+
+
+def _normalize_crs(crs: np.ndarray) -> np.ndarray:
+    """Normalize courses to (-180, 180], rounded to 2 decimal places."""
+    return np.round(normalize_angles(crs), 2)
+
+
+def _calc_batch_params(
+    origins: np.ndarray,
+    termini: np.ndarray,
+    radius: float,
+    turns: list[Turn],
+    case: DubinsType,
+) -> tuple[np.ndarray, ...]:
+    """Compute the CSC construction parameters for the whole batch.
+
+    Parameters
+    ----------
+    origins, termini: ndarray
+        (n, 3) arrays of (x, y, crs) rows.
+    radius: float
+        Turn radius, unitless.
+    turns: list[Turn]
+        Turns to execute.
+    case: DubinsType
+        Enum defining the Dubins path type.
+
+    Returns
+    -------
+    tuple of ndarray
+        Per-path arrays (ox, oy, cx0, cy0, s0, cx1, cy1, s1, d, theta,
+        psi0, psi_f).
+    """
+    o_norm = _normalize_crs(origins[:, 2])
+    t_norm = _normalize_crs(termini[:, 2])
+
+    # Circle centers for both turns, vectorized over the batch.
+    o_rad = np.deg2rad(o_norm)
+    t_rad = np.deg2rad(t_norm)
+    cx0 = origins[:, 0] + turns[0].value * radius * np.cos(o_rad)
+    cy0 = origins[:, 1] - turns[0].value * radius * np.sin(o_rad)
+    cx1 = termini[:, 0] + turns[1].value * radius * np.cos(t_rad)
+    cy1 = termini[:, 1] - turns[1].value * radius * np.sin(t_rad)
+
+    dist = np.hypot(cx1 - cx0, cy1 - cy0)
+
+    # Hemisphere case: origin and terminus are orthogonal and exactly a
+    # turn diameter apart, so the path is a single arc. Computed before
+    # the tangent geometry so hemisphere rows are exempt from the
+    # infeasibility check below -- their circles may overlap, exactly as
+    # in the scalar DubinsCSC constructor.
+    az = calc_azimuth_batch(origins[:, :2], termini[:, :2])
+    diff = np.abs(az - np.mod(origins[:, 2] + 180., 360.))
+    beta = np.minimum(diff, 360. - diff)
+    wpt_dist = np.hypot(
+        termini[:, 0] - origins[:, 0], termini[:, 1] - origins[:, 1])
+
+    hemisphere = (
+        (np.abs(beta) >= 89.) & (np.abs(beta) <= 91.)
+        & (np.abs(wpt_dist - 2. * radius) <= 1e-3))
+
+    if case in _STRAIGHT_CASES:
+        d = dist
+        theta = 90. - np.degrees(np.arctan2(cy1 - cy0, cx1 - cx0))
+    else:
+        # Factored form avoids cancellation when dist is close to 2r.
+        d_sq = (dist - 2. * radius) * (dist + 2. * radius)
+
+        if np.any((d_sq < 0.) & ~hemisphere):
+            raise ValueError(
+                'Turn radius too large for at least one origin/terminus'
+                ' pair')
+
+        # Hemisphere rows can carry a negative d_sq; their d and theta
+        # are overwritten below, so clamp to keep the sqrt clean.
+        d = np.sqrt(np.maximum(d_sq, 0.))
+        eta = 90. - np.degrees(np.arctan2(cy1 - cy0, cx1 - cx0))
+        gamma = np.degrees(np.arctan(d / (2. * radius)))
+
+        if case == DubinsType.LSR:
+            theta = eta + gamma - 90.
+        else:
+            # RSL case
+            theta = eta - gamma + 90.
+
+    theta = normalize_angles(theta)
+
+    d = np.where(hemisphere, -1., d)
+    theta = np.where(hemisphere, t_norm, theta)
+
+    s0 = np.full(len(origins), turns[0].value)
+    s1 = np.full(len(origins), turns[1].value)
+
+    return (origins[:, 0], origins[:, 1], cx0, cy0, s0, cx1, cy1, s1, d,
+            theta, o_norm, t_norm)
+
+
+def _sample_csc(
+    ox: float,
+    oy: float,
+    cx0: float,
+    cy0: float,
+    s0: int,
+    cx1: float,
+    cy1: float,
+    s1: int,
+    d: float,
+    theta: float,
+    psi0: float,
+    psi_f: float,
+    radius: float,
+    delta_psi: float,
+    delta_d: float,
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
+    """Sample one CSC path from precomputed construction parameters.
+
+    Mirrors DubinsCSC.create_path.
+
+    Returns
+    -------
+    ndarray
+        (n, 2) array of point coordinates.
+    """
+    points, _, psi = arc_points(
+        cx0, cy0, s0, radius, psi0, theta, delta_psi, dtype=dtype)
+
+    if d != -1:
+        if len(points):
+            x_p, y_p = points[-1]
+        else:
+            x_p, y_p = ox, oy
+            points = np.array([[x_p, y_p]], dtype=dtype)
+
+        points = np.concatenate(
+            (points, line_points(x_p, y_p, theta, delta_d, d, dtype=dtype)))
+
+    if psi != psi_f:
+        arc2, _, _ = arc_points(
+            cx1, cy1, s1, radius, psi, psi_f, delta_psi, dtype=dtype)
+        points = np.concatenate((points, arc2))
+
+    return points
@@ -1,14 +1,13 @@
 """This module a class to construct Dubins paths in Cartesian space."""
 from __future__ import annotations
-from math import isclose, sqrt
-from typing import TypeAlias
+from math import sqrt
 
-from ._dubins_base import DubinsBase, DubinsType, Circle, Turn
-from .point import Circle, IntermediatePoint, Waypoint
-from .mathlib import arctan, arctan2, normalize_angle
+import numpy as np
 
-
-Point: TypeAlias = tuple[float, float]
+from ._dubins_base import DubinsBase, DubinsType, Turn, _STRAIGHT_CASES
+from .batch import create_paths_batch
+from .point import Circle, Waypoint
+from .mathlib import arctan, arctan2, normalize_angle, sincos
 
 
 class DubinsCSC(DubinsBase):
@@ -97,12 +96,21 @@ class DubinsCSC(DubinsBase):
         """
         super().__init__(origin, terminus, radius)
         self.case = DubinsType.from_turns(turns)
+        self._is_straight = self.case in _STRAIGHT_CASES
+        self._compute_theta = getattr(self, _THETA_METHODS[self.case])
         self.circles = self._init_circles(turns)
         self.psi = origin.crs_norm
 
+        # Cheap squared-distance reject first: only waypoints within
+        # tolerance of a turn diameter apart can be the hemisphere case,
+        # so the atan2-based beta check rarely runs at all.
+        dist_sq = origin.distance_sq_to(terminus)
+        lo = max(0., self._two_r - 1e-3)
+        hi = self._two_r + 1e-3
+
         if (
-            89 <= abs(origin.calc_beta(terminus)) <= 91
-            and isclose(origin.distance_to(terminus), 2*radius, abs_tol=1e-3)
+            lo * lo <= dist_sq <= hi * hi
+            and 89 <= abs(origin.calc_beta(terminus)) <= 91
         ):
             # Hemisphere case
             self.d = -1
@@ -111,11 +119,14 @@ class DubinsCSC(DubinsBase):
             self.d = self._calc_d()
             self.theta = self._calc_theta()
 
+        self._init_tangent_points()
+
     def create_path(
         self,
         delta_psi: float = 1,
         delta_d: float = 1,
-    ) -> list[IntermediatePoint]:
+        dtype: np.dtype = np.float64,
+    ) -> np.ndarray:
         """Construct a LSL or RSR path.
 
         Parameters
@@ -125,31 +136,78 @@ class DubinsCSC(DubinsBase):
         delta_d: float, optional
             Interval at which to compute tangent line connecting the two
             circles, in meters. Default is 1.
+        dtype: np.dtype, optional
+            Dtype of the output point array. Default is np.float64;
+            np.float32 halves the memory footprint at the cost of
+            sub-millimeter positional error.
 
         Returns
         -------
-        list of IntermediatePoint
-            IntermediatePoints forming the Dubins path.
+        ndarray
+            (n, 2) array of point coordinates forming the Dubins path.
         """
-        waypoints = []
-        waypoints.extend(
-            self._calc_arc_points(self.circles[0], self.theta, delta_psi))
+        # Sample every segment into one preallocated buffer, sized by the
+        # n_points upper bound, instead of concatenating per-segment
+        # arrays (which copies the points already emitted each time).
+        buf = np.empty((self.n_points(delta_psi, delta_d), 2), dtype=dtype)
+
+        n = len(self._calc_arc_points(
+            self.circles[0], self.theta, delta_psi, dtype=dtype, out=buf))
 
         if self.d != -1:
-            try:
-                prev_wpt = waypoints[-1]
-            except IndexError:
-                prev_wpt = IntermediatePoint.from_waypoint(self.origin)
-                waypoints = [prev_wpt]
+            if n:
+                line_origin = buf[n - 1]
+            else:
+                line_origin = self.origin.xy
+                buf[0] = line_origin
+                n = 1
 
-            waypoints.extend(self._calc_line_points(prev_wpt, delta_d))
+            n += len(self._calc_line_points(
+                line_origin, delta_d, dtype=dtype, out=buf[n:]))
 
         if self.psi != self.terminus.crs_norm:
-            waypoints.extend(
-                self._calc_arc_points(
-                    self.circles[1], self.terminus.crs_norm, delta_psi))
+            n += len(self._calc_arc_points(
+                self.circles[1], self.terminus.crs_norm, delta_psi,
+                dtype=dtype, out=buf[n:]))
+
+        return buf[:n]
+
+    @classmethod
+    def batch(
+        cls,
+        origins: np.ndarray,
+        termini: np.ndarray,
+        radius: float,
+        turns: list[Turn],
+        **kwargs,
+    ) -> list[np.ndarray]:
+        """Create many CSC paths at once with vectorized construction.
+
+        Convenience front end for batch.create_paths_batch, which
+        computes every path's construction parameters (circle centers,
+        d, theta) in single NumPy passes rather than one scalar
+        __init__ per path.
+
+        Parameters
+        ----------
+        origins: ndarray
+            (n, 3) array of path origins as (x, y, crs) rows.
+        termini: ndarray
+            (n, 3) array of path termini as (x, y, crs) rows.
+        radius: float
+            Turn radius, unitless.
+        turns: list[Turn]
+            Turns to execute. Must have a length of 2.
+        kwargs: optional
+            Keyword arguments to pass to create_paths_batch().
 
-        return waypoints
+        Returns
+        -------
+        list of ndarray
+            One (n_i, 2) array of point coordinates per origin/terminus
+            pair.
+        """
+        return create_paths_batch(origins, termini, radius, turns, **kwargs)
 
     def _init_circles(self, turns: list[Turn]) -> list[Circle]:
         """Compute the center of the circles to rotate about."""
@@ -157,6 +215,33 @@ class DubinsCSC(DubinsBase):
             self._init_circle(point, t)
             for point, t in zip([self.origin, self.terminus], turns)]
 
+    def _init_tangent_points(self) -> None:
+        """Cache the exact endpoints of the tangent line segment.
+
+        The segment ends are fixed by the construction geometry, so they
+        are computed once here rather than re-derived from sampled arc
+        points on every create_path() call. Both are None for the
+        hemisphere case, which has no straight segment.
+        """
+        if self.d == -1:
+            self._p1 = self._p2 = None
+            return
+
+        sin_t, cos_t = sincos(self.theta)
+        sr = self.circles[0].s * self.radius
+
+        self._p1 = (
+            self.circles[0].x - sr * cos_t, self.circles[0].y + sr * sin_t)
+        self._p2 = (
+            self._p1[0] + self.d * sin_t, self._p1[1] + self.d * cos_t)
+
+    @property
+    def tangent_points(
+            self) -> tuple[tuple[float, float], ...] | tuple[None, None]:
+        """Return the cached endpoints of the tangent line segment, or
+        (None, None) for the hemisphere case."""
+        return self._p1, self._p2
+
     def _calc_d(self) -> float:
         """Calculate the length of the line segment connecting the tangent
         points on the two circles.
@@ -173,15 +258,36 @@ class DubinsCSC(DubinsBase):
         Raises
         ------
         ValueError
-            If the turn radius is too large, attempting to take the square
-            root in the last line of the method becomes invalid.
+            If the turn radius is too large for an LSR/RSL path between
+            the origin and terminus.
+
+        Notes
+        -----
+        * The LSR/RSL branch uses the factored form
+          (dist - 2r) * (dist + 2r) rather than dist**2 - 4r**2: it is
+          algebraically identical but avoids catastrophic cancellation
+          when dist is close to 2r. A turn radius at the geometric limit
+          is clamped to a zero-length tangent instead of raising a
+          domain error from floating-point noise; a genuinely infeasible
+          radius still raises.
         """
-        dist = self.circles[0].distance_to(self.circles[1])
+        d_sq = self.circles[0].distance_sq_to(self.circles[1])
+
+        if self._is_straight:
+            return sqrt(d_sq)
+
+        dist = sqrt(d_sq)
+
+        if dist < self._two_r:
+            if self._two_r - dist > 1e-9:
+                raise ValueError(
+                    f'Turn radius {self.radius} too large for a'
+                    f' {self.case.name} path between {self.origin} and'
+                    f' {self.terminus}')
 
-        if self.case in [DubinsType.LSL, DubinsType.RSR]:
-            return dist
+            return 0.
 
-        return sqrt(dist**2 - (4 * self.radius**2))
+        return sqrt((dist - self._two_r) * (dist + self._two_r))
 
     def _calc_theta(self) -> float:
         """Compute the angle of the line connecting the tangent points
@@ -213,21 +319,41 @@ class DubinsCSC(DubinsBase):
                     g = arccos((2 * radius) / d)
                   however its correct form is:
                     g = arctan(d / (2 * radius))
+        * Dispatches to the per-case method bound at __init__, avoiding
+          a chain of DubinsType comparisons on every call.
         """
+        return normalize_angle(self._compute_theta())
+
+    def _calc_eta(self) -> float:
+        """Compute the angle formed by the vector connecting the two circle
+        centers and the positive y-axis, in degrees."""
         x_i, y_i = self.circles[0].xy
         x_f, y_f = self.circles[1].xy
-        theta = None
-
-        if self.case in [DubinsType.LSL, DubinsType.RSR]:
-            theta = 90 - arctan2((y_f - y_i), (x_f - x_i))
-        elif self.case == DubinsType.LSR:
-            eta = 90 - arctan2((y_f - y_i), (x_f - x_i))
-            gamma = arctan(self.d / (2 * self.radius))
-            theta = eta + gamma - 90
-        else:
-            # RSL case
-            eta = 90 - arctan2((y_f - y_i), (x_f - x_i))
-            gamma = arctan(self.d / (2 * self.radius))
-            theta = eta - gamma + 90
 
-        return normalize_angle(theta)
+        return 90 - arctan2((y_f - y_i), (x_f - x_i))
+
+    def _theta_straight(self) -> float:
+        """Compute theta for the LSL and RSR cases."""
+        return self._calc_eta()
+
+    def _theta_lsr(self) -> float:
+        """Compute theta for the LSR case."""
+        gamma = arctan(self.d / self._two_r)
+
+        return self._calc_eta() + gamma - 90
+
+    def _theta_rsl(self) -> float:
+        """Compute theta for the RSL case."""
+        gamma = arctan(self.d / self._two_r)
+
+        return self._calc_eta() - gamma + 90
+
+
+# Per-case theta methods, bound once at __init__ so the hot path is a
+# direct call rather than an Enum-comparison chain.
+_THETA_METHODS = {
+    DubinsType.LSL: '_theta_straight',
+    DubinsType.RSR: '_theta_straight',
+    DubinsType.LSR: '_theta_lsr',
+    DubinsType.RSL: '_theta_rsl',
+}
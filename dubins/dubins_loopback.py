@@ -1,13 +1,11 @@
 from math import sqrt
-from typing import TypeAlias
-
-from ._dubins_base import DubinsBase, DubinsType, Circle, Turn
-from .point import Circle, IntermediatePoint, Waypoint
-from .mathlib import (
-    calc_distance, calc_fwd, arccos, sin, normalize_angle, subtract_azimuths)
 
+import numpy as np
 
-Point: TypeAlias = tuple[float, float]
+from ._dubins_base import DubinsBase, DubinsType, Turn
+from .point import Circle, Waypoint
+from .mathlib import (
+    calc_distance, calc_fwd, arccos, sin, normalize_angle)
 
 
 class DubinsLoopback(DubinsBase):
@@ -51,6 +49,7 @@ class DubinsLoopback(DubinsBase):
     """
 
     case = DubinsType.LOOPBACK
+    _is_loopback = True
 
     def __init__(
         self,
@@ -81,32 +80,40 @@ class DubinsLoopback(DubinsBase):
         """
         super().__init__(origin, terminus, radius)
 
-        beta = origin.calc_beta(terminus)
+        dist = origin.distance_to(terminus)
+        # Inlined origin.calc_beta(terminus): azimuth_to already returns
+        # [0, 360), so one mod and one branch replace the nested
+        # subtract_azimuths/azimuth call frames.
+        diff = abs(origin.azimuth_to(terminus) - (origin.crs + 180.) % 360.)
+        beta = diff if diff <= 180. else 360. - diff
         if 89 < beta < 91:
-            track_spacing = self.origin.distance_to(self.terminus)
+            track_spacing = dist
         else:
-            track_spacing = abs(origin.distance_to(terminus) * sin(beta))
+            track_spacing = abs(dist * sin(beta))
 
-        turn1 = Turn.reverse(turns[0])
-        h = sqrt((2 * radius)**2 - track_spacing**2)
-        # a = (round(arccos(h / (2 * radius)), 4) + origin.crs) * -turn1.value
-        a = origin.crs + (-turn1.value * round(arccos(h / (2 * radius)), 4))
+        turn1 = -turns[0]
+        # Raw sign int read out of the Enum once; all the arithmetic
+        # below stays on plain ints.
+        s1 = turn1.value
+        h = sqrt(self._four_r_sq - track_spacing * track_spacing)
+        a = origin.crs + (-s1 * arccos(h / self._two_r))
 
         circle1 = self._init_circle(origin, turn1)
         self.circles = [
             circle1,
-            Circle(*calc_fwd(circle1.xy, a, self.radius*2), turns[1].value),
+            Circle(*calc_fwd(circle1.xy, a, self._two_r), turns[1].value),
         ]
 
         self.d = h
-        self.theta = normalize_angle(a + (90 * turn1.value))
+        self.theta = normalize_angle(a + (90 * s1))
         self.psi = origin.crs_norm
 
     def create_path(
         self,
         delta_d = 1,
         delta_psi: float = 1,
-    ) -> list[IntermediatePoint]:
+        dtype: np.dtype = np.float64,
+    ) -> np.ndarray:
         """Construct a LSL or RSR path.
 
         Parameters
@@ -116,28 +123,36 @@ class DubinsLoopback(DubinsBase):
         delta_d: float, optional
             Interval at which to compute tangent line connecting the two
             circles, in meters. Default is 1.
+        dtype: np.dtype, optional
+            Dtype of the output point array. Default is np.float64;
+            np.float32 halves the memory footprint at the cost of
+            sub-millimeter positional error.
 
         Returns
         -------
-        list of IntermediatePoint
-            IntermediatePoints forming the Dubins path.
+        ndarray
+            (n, 2) array of point coordinates forming the Dubins path.
         """
-        waypoints = []
+        # Sample both arcs (and the closing segment, if any) into one
+        # preallocated buffer, sized by the n_points upper bound, instead
+        # of concatenating per-segment arrays.
+        buf = np.empty((self.n_points(delta_psi, delta_d), 2), dtype=dtype)
 
-        waypoints.extend(
-            self._calc_arc_points(self.circles[0], self.theta, delta_psi))
+        n = len(self._calc_arc_points(
+            self.circles[0], self.theta, delta_psi, dtype=dtype, out=buf))
+        n += len(self._calc_arc_points(
+            self.circles[1], self.terminus.crs_norm, delta_psi,
+            dtype=dtype, out=buf[n:]))
 
-        waypoints.extend(
-            self._calc_arc_points(
-                self.circles[1],
-                self.terminus.crs_norm,
-                delta_psi))
+        points = buf[:n]
 
-        if waypoints[-1].distance_to(self.terminus) > delta_d:
-            self.d = waypoints[-1].distance_to(self.terminus)
+        if calc_distance(points[-1], self.terminus.xy) > delta_d:
+            self.d = calc_distance(points[-1], self.terminus.xy)
             self.theta = self.terminus.crs_norm
-            waypoints.extend(self._calc_line_points(waypoints[-1], delta_d))
+            n += len(self._calc_line_points(
+                points[-1], delta_d, dtype=dtype, out=buf[n:]))
+            points = buf[:n]
 
-        self.length += calc_distance(waypoints[-1].xy, self.terminus.xy)
+        self.length += calc_distance(points[-1], self.terminus.xy)
 
-        return waypoints
+        return points
@@ -1,5 +1,38 @@
 """This module contains various math constants and functions."""
+import cmath
 import math
+from functools import lru_cache
+
+import numpy as np
+
+
+# Module-level bindings skip the math-module attribute lookup on every call.
+_acos = math.acos
+_asin = math.asin
+_atan = math.atan
+_atan2 = math.atan2
+_cos = math.cos
+_cosh = math.cosh
+_hypot = math.hypot
+_rect = cmath.rect
+_remainder = math.remainder
+_sin = math.sin
+_sqrt = math.sqrt
+_tan = math.tan
+
+# Precomputed conversion factors; multiplying by these matches
+# math.radians/math.degrees bit-for-bit without the extra C call.
+_DEG2RAD = math.pi / 180.
+_RAD2DEG = 180. / math.pi
+
+# Sine lookup table at 0.1 degree resolution. The extra entry at 360.0
+# lets fast_sin_deg interpolate without wrapping the upper index.
+_SIN_TBL = [math.sin(math.radians(i * 0.1)) for i in range(3601)]
+
+# Exact sine/cosine at whole degrees, for the integer fast path in
+# sin()/cos(); entries match the libm results bit-for-bit.
+_SIN_DEG = [math.sin(math.radians(i)) for i in range(360)]
+_COS_DEG = [math.cos(math.radians(i)) for i in range(360)]
 
 
 def calc_azimuth(
@@ -48,7 +81,7 @@ def calc_distance(
     x1, y1 = point1
     x2, y2 = point2
 
-    return math.sqrt((x2-x1)**2 + (y2-y1)**2)
+    return _hypot(x2 - x1, y2 - y1)
 
 
 def calc_fwd(
@@ -74,38 +107,149 @@ def calc_fwd(
         X- and y-coodinates of the new point.
     """
     x, y = origin
-    azimuth %= 360.
+    sin_azi, cos_azi = sincos(azimuth % 360.)
+
+    return x + dist * sin_azi, y + dist * cos_azi
+
+
+def calc_distance_batch(
+    points1: np.ndarray,
+    points2: np.ndarray,
+) -> np.ndarray:
+    """Calculate the Euclidean distances between two arrays of points.
+
+    Array counterpart of calc_distance: one vectorized pass replaces a
+    Python call per pair.
+
+    Parameters
+    ----------
+    points1: ndarray
+        (n, 2) array of point x- and y-coordinates.
+    points2: ndarray
+        (n, 2) array of point x- and y-coordinates.
 
-    return x + dist * sin(azimuth), y + dist * cos(azimuth)
+    Returns
+    -------
+    ndarray
+        (n,) array of unitless Euclidean distances.
+    """
+    points1 = np.asarray(points1)
+    points2 = np.asarray(points2)
+
+    return np.hypot(
+        points2[..., 0] - points1[..., 0], points2[..., 1] - points1[..., 1])
+
+
+def calc_azimuth_batch(
+    points1: np.ndarray,
+    points2: np.ndarray,
+) -> np.ndarray:
+    """Calculate the azimuths of the vectors defined by two arrays of
+    points.
+
+    Array counterpart of calc_azimuth: three ufunc passes replace a
+    Python call per pair.
 
+    Parameters
+    ----------
+    points1: ndarray
+        (n, 2) array of point x- and y-coordinates.
+    points2: ndarray
+        (n, 2) array of point x- and y-coordinates.
+
+    Returns
+    -------
+    ndarray
+        (n,) array of azimuths, in degrees from positive y-axis.
+    """
+    points1 = np.asarray(points1)
+    points2 = np.asarray(points2)
 
+    return np.mod(
+        np.degrees(np.arctan2(
+            points2[..., 0] - points1[..., 0],
+            points2[..., 1] - points1[..., 1])),
+        360.)
+
+
+def calc_fwd_batch(
+    origins: np.ndarray,
+    azimuths: np.ndarray,
+    dists: np.ndarray,
+) -> np.ndarray:
+    """Calculate new points from arrays of origins, azimuths, and
+    distances.
+
+    Array counterpart of calc_fwd.
+
+    Parameters
+    ----------
+    origins: ndarray
+        (n, 2) array of origin x- and y-coordinates.
+    azimuths: ndarray
+        (n,) array of azimuths to move along, in degrees.
+    dists: ndarray
+        (n,) array of unitless distances.
+
+    Returns
+    -------
+    ndarray
+        (n, 2) array of x- and y-coordinates of the new points.
+    """
+    origins = np.asarray(origins)
+    rads = np.asarray(azimuths) * _DEG2RAD
+    dists = np.asarray(dists)
+
+    out = np.empty(origins.shape)
+    out[..., 0] = origins[..., 0] + dists * np.sin(rads)
+    out[..., 1] = origins[..., 1] + dists * np.cos(rads)
+
+    return out
+
+
+@lru_cache(maxsize=2048)
 def arccos(val: float) -> float:
     """Compute the trigonometric inverse cosine and return the value
     in degrees."""
-    return math.degrees(math.acos(val))
+    return _acos(val) * _RAD2DEG
 
 
 def arcsin(val: float) -> float:
     """Compute the trigonometric inverse sine and return the value
     in degrees."""
-    return math.degrees(math.asin(val))
+    return _asin(val) * _RAD2DEG
 
 
 def arctan(val: float) -> float:
     """Compute the trigonometric inverse tangent and return the value
     in degrees."""
-    return math.degrees(math.atan(val))
+    return _atan(val) * _RAD2DEG
 
 
 def arctan2(y: float, x: float) -> float:
     """Compute the trigonometric inverse tangent and return the value
     in degrees."""
-    return math.degrees(math.atan2(y, x))
+    return _atan2(y, x) * _RAD2DEG
+
+
+@lru_cache(maxsize=2048)
+def _cos_deg(val: float) -> float:
+    """Memoized cosine of a non-integer angle given in degrees."""
+    return _cos(val * _DEG2RAD)
+
+
+@lru_cache(maxsize=2048)
+def _sin_deg(val: float) -> float:
+    """Memoized sine of a non-integer angle given in degrees."""
+    return _sin(val * _DEG2RAD)
 
 
 def cos(val: float) -> float:
     """Compute the cosine of an angle given in degrees.
 
+    Whole-degree int arguments — the common case for arc sweeps at the
+    default delta_psi — resolve through a precomputed table.
+
     Parameters
     ----------
     val: float
@@ -115,12 +259,62 @@ def cos(val: float) -> float:
     -------
     float
     """
-    return math.cos(math.radians(val))
+    if val.__class__ is int:
+        return _COS_DEG[val % 360]
+
+    return _cos_deg(val)
 
 
 def sin(val: float) -> float:
     """Compute the sine of an angle given in degrees.
 
+    Whole-degree int arguments — the common case for arc sweeps at the
+    default delta_psi — resolve through a precomputed table.
+
+    Parameters
+    ----------
+    val: float
+        Angle, in degrees.
+
+    Returns
+    -------
+    float
+    """
+    if val.__class__ is int:
+        return _SIN_DEG[val % 360]
+
+    return _sin_deg(val)
+
+
+def sincos(val: float) -> tuple[float, float]:
+    """Compute the sine and cosine of an angle given in degrees.
+
+    The degree-to-radian conversion is performed once, and both values
+    come from a single cmath.rect call (the unit phasor cos + i*sin),
+    which is cheaper than separate sin and cos calls and returns the
+    same bits.
+
+    Parameters
+    ----------
+    val: float
+        Angle, in degrees.
+
+    Returns
+    -------
+    tuple of float, float
+        Sine and cosine of the angle.
+    """
+    z = _rect(1., val * _DEG2RAD)
+
+    return z.imag, z.real
+
+
+def fast_sin_deg(val: float) -> float:
+    """Approximate the sine of an angle given in degrees via table lookup.
+
+    Linearly interpolates a 0.1-degree-resolution table, trading a libm
+    call for two list lookups; the maximum absolute error is below 4e-7.
+
     Parameters
     ----------
     val: float
@@ -130,7 +324,31 @@ def sin(val: float) -> float:
     -------
     float
     """
-    return math.sin(math.radians(val))
+    # Float mod can return the modulus exactly for tiny negative
+    # angles -- (-1e-16) % 360. == 360.0 -- so clamp the index to keep
+    # the interpolation inside the table.
+    scaled = (val % 360.) * 10.
+    i = min(int(scaled), 3599)
+    lo = _SIN_TBL[i]
+
+    return lo + (_SIN_TBL[i + 1] - lo) * (scaled - i)
+
+
+def fast_cos_deg(val: float) -> float:
+    """Approximate the cosine of an angle given in degrees via table lookup.
+
+    See fast_sin_deg for the accuracy tradeoff.
+
+    Parameters
+    ----------
+    val: float
+        Angle, in degrees.
+
+    Returns
+    -------
+    float
+    """
+    return fast_sin_deg(val + 90.)
 
 
 def sec(val: float) -> float:
@@ -145,12 +363,12 @@ def sec(val: float) -> float:
     -------
     float
     """
-    return 1 / math.cos(math.radians(val))
+    return 1 / _cos(val * _DEG2RAD)
 
 
 def sech(val: float) -> float:
   """Compute the hyperbolic secant of the given value."""
-  return 1 / math.cosh(val)
+  return 1 / _cosh(val)
 
 
 def tan(val: float) -> float:
@@ -165,7 +383,7 @@ def tan(val: float) -> float:
     -------
     float
     """
-    return math.tan(math.radians(val))
+    return _tan(val * _DEG2RAD)
 
 
 def azimuth(val: float) -> float:
@@ -173,16 +391,40 @@ def azimuth(val: float) -> float:
     return val % 360.
 
 
+def azimuth_to_uangle(val: float) -> float:
+    """Convert an azimuth to a unit-circle angle.
+
+    Parameters
+    ----------
+    val: float
+        Azimuth, in degrees clockwise from the positive y-axis.
+
+    Returns
+    -------
+    float
+        Angle, in degrees counter-clockwise from the positive x-axis.
+    """
+    return (90. - val) % 360.
+
+
 def normalize_angle(val: float) -> float:
     """Normalize an angle to (-180, 180]."""
-    normalized = ((val + 180) % 360) - 180
+    # IEEE-754 remainder lands in [-180, 180] in a single libm call, but
+    # can return either endpoint for angles equivalent to 180 (ties round
+    # to the even quotient), so the -180 endpoint still needs folding.
+    normalized = _remainder(val, 360.)
 
-    return 180 if normalized == -180 else normalized
+    return 180. if normalized == -180. else normalized
 
 
+@lru_cache(maxsize=8192)
 def subtract_azimuths(azi1: float, azi2: float) -> float:
     """Compute the minimum angle between two azimuths.
 
+    Repeated azimuth pairs — e.g. the same waypoints queried across
+    several candidate paths — are served from a bounded cache; the
+    function is pure, so the cache never needs invalidation.
+
     Parameters
     ----------
     azi1: float
@@ -192,6 +434,7 @@ def subtract_azimuths(azi1: float, azi2: float) -> float:
     -------
     float
     """
-    diff = abs(azimuth(azi1) - azimuth(azi2))
-
-    return min(diff, 360 - diff)
+    # The IEEE-754 remainder of the raw difference lands in [-180, 180],
+    # so its absolute value is the minimal angular separation — one libm
+    # call instead of two mods, an abs, and a min.
+    return abs(_remainder(azi1 - azi2, 360.))
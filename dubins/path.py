@@ -0,0 +1,93 @@
+"""This module contains a structure-of-arrays container for sampled
+Dubins paths."""
+from __future__ import annotations
+
+import numpy as np
+
+from .point import IntermediatePoint
+
+
+class PathArray:
+    """Structure-of-arrays container for a sampled Dubins path.
+
+    Stores the path as parallel NumPy arrays rather than per-point
+    Python objects, so downstream vectorized transforms (distance,
+    smoothing, collision checks) operate on the arrays directly.
+    Per-point IntermediatePoint objects are only materialized on demand.
+
+    Attributes
+    ----------
+    points: ndarray
+        (n, 2) array of point coordinates.
+    psis: ndarray
+        (n,) array of headings, in degrees (-180, 180].
+    """
+
+    def __init__(self, points: np.ndarray, psis: np.ndarray):
+        """Instantiate a new PathArray.
+
+        Parameters
+        ----------
+        points: ndarray
+            (n, 2) array of point coordinates.
+        psis: ndarray
+            (n,) array of headings, in degrees (-180, 180].
+        """
+        self.points = points
+        self.psis = psis
+        self._seg_lengths = None
+
+    @property
+    def x(self) -> np.ndarray:
+        """Return the x-coordinates as a view of the point array."""
+        return self.points[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Return the y-coordinates as a view of the point array."""
+        return self.points[:, 1]
+
+    @property
+    def seg_lengths(self) -> np.ndarray:
+        """Return the lengths of the segments connecting consecutive
+        points.
+
+        The first entry is 0. Computed with one vectorized pass on first
+        access and cached.
+        """
+        if self._seg_lengths is None:
+            self._seg_lengths = np.zeros(len(self.points))
+            self._seg_lengths[1:] = np.hypot(
+                np.diff(self.points[:, 0]), np.diff(self.points[:, 1]))
+
+        return self._seg_lengths
+
+    def to_intermediate_points(self) -> list[IntermediatePoint]:
+        """Materialize the path as a list of IntermediatePoint objects.
+
+        Segment lengths are computed from consecutive points; the first
+        point gets a segment length of 0.
+
+        Returns
+        -------
+        list of IntermediatePoint
+        """
+        seg_lengths = self.seg_lengths
+
+        return [
+            IntermediatePoint(x, y, psi, seg)
+            for (x, y), psi, seg
+            in zip(self.points.tolist(), self.psis.tolist(),
+                   seg_lengths.tolist())]
+
+    def __len__(self) -> int:
+        """Return the number of points in the path."""
+        return len(self.points)
+
+    def __iter__(self):
+        """Iterate over the (x, y) rows of the point array."""
+        return iter(self.points)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the object."""
+        return f'<{self.__class__.__name__} n={len(self.points)}>'
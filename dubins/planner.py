@@ -1,10 +1,19 @@
 from math import ceil
 
+import numpy as np
+
 from ._dubins_base import Turn
 from .dubins_csc import DubinsCSC
 from .dubins_loopback import DubinsLoopback
 from .mathlib import calc_fwd, sin
-from .point import IntermediatePoint, Waypoint
+from .point import Waypoint
+
+
+# Absolute tolerance for the class-selection distance comparisons: half
+# the 0.01 quantum of the round(..., 2) checks it replaced, so values
+# that previously rounded up to the boundary still classify the same
+# way.
+_TOL = 0.005
 
 
 def create_path(
@@ -13,7 +22,7 @@ def create_path(
     radius: float,
     turns: list[Turn],
     **kwargs,
-) -> list[IntermediatePoint]:
+) -> np.ndarray:
     """Create a Dubins path and return the waypoints.
 
     This function handles the determination of which Dubins class to use
@@ -35,12 +44,14 @@ def create_path(
 
     Returns
     -------
-    list of IntermediatePoint
-        IntermediatePoints forming the Dubins path.
+    ndarray
+        (n, 2) array of point coordinates forming the Dubins path.
     """
     d = get_dubins(origin, terminus, radius, turns)
 
-    if isinstance(d, DubinsLoopback):
+    # Class-level bool read instead of isinstance; a plain attribute
+    # load hits CPython's type cache on this hot path.
+    if d._is_loopback:
         kwargs.pop('delta_d', None)
 
     return d.create_path(**kwargs)
@@ -69,24 +80,22 @@ def get_dubins(
     -------
     DubinsCSC | DubinsLoopback
     """
-    wpt_dist = round(origin.distance_to(terminus), 2)
+    wpt_dist = origin.distance_to(terminus)
     beta = origin.calc_beta(terminus)
     are_orthogonal = (89 < beta < 91) or (269 < beta < 271)
 
     if are_orthogonal:
         xtrack_dist = wpt_dist
     else:
-        xtrack_dist = round(
-            abs(origin.distance_to(terminus)
-                * sin(origin.calc_beta(terminus))), 2)
+        xtrack_dist = abs(wpt_dist * sin(beta))
 
     if are_orthogonal:
-        if xtrack_dist < 2 * radius:
+        if xtrack_dist < 2 * radius - _TOL:
             return DubinsLoopback(origin, terminus, radius, turns)
         else:
             return DubinsCSC(origin, terminus, radius, turns)
     else:
-        if xtrack_dist >= 2 * radius:
+        if xtrack_dist >= 2 * radius - _TOL:
             return DubinsCSC(origin, terminus, radius, turns)
         else:
             # if wpt_dist >= 2 * radius:
@@ -1,18 +1,21 @@
 import matplotlib.pyplot as plt
+import numpy as np
 
+from .path import PathArray
 from .point import Circle
 
 
 def plot_path(
-    path: list[tuple[float, float]],
+    path: np.ndarray | PathArray | list[tuple[float, float]],
     circles: list[Circle] | None = None,
 ) -> None:
     """Plot a Dubins path.
 
     Parameters
     ----------
-    path: list of tuple[float, float]
-        Dubins path points.
+    path: ndarray, PathArray, or list of tuple[float, float]
+        Dubins path points. Arrays and PathArrays are plotted without
+        copying; lists of tuples are converted once.
     circles: list of Circle, optional
         Circles used to construct the path. If given, their centroids are
         plotted as black dots.
@@ -21,12 +24,17 @@ def plot_path(
     -------
     None
     """
-    x, y = list(zip(*path))
+    if isinstance(path, PathArray):
+        points = path.points
+    else:
+        points = np.asarray(path)
+
+    x, y = points[:, 0], points[:, 1]
 
     plt.plot(x, y, zorder=0)
 
-    plt.scatter(*path[0], color='green', marker='o', zorder=1)
-    plt.scatter(*path[-1], color='red', marker='o', zorder=1)
+    plt.scatter(*points[0], color='green', marker='o', zorder=1)
+    plt.scatter(*points[-1], color='red', marker='o', zorder=1)
 
     if circles:
         plt.scatter(*circles[0].xy, color='black', marker='o', zorder=2)
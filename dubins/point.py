@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from .mathlib import (
-    calc_azimuth, calc_distance, normalize_angle, subtract_azimuths)
+    calc_azimuth, calc_distance, normalize_angle, sincos, subtract_azimuths)
 
 
 class PointBase:
@@ -15,6 +15,8 @@ class PointBase:
         Y-coordinate.
     """
 
+    __slots__ = ('x', 'y', '_xy')
+
     def __init__(self, x: float, y: float):
         """Container for circle parameters.
 
@@ -27,11 +29,14 @@ class PointBase:
         """
         self.x = x
         self.y = y
+        # Coordinates are never reassigned after construction, so the
+        # tuple is built once instead of on every xy access.
+        self._xy = (x, y)
 
     @property
     def xy(self) -> tuple[float, float]:
         """Return the x- and y-coordinates."""
-        return self.x, self.y
+        return self._xy
 
     def azimuth_to(self, p: PointBase) -> float:
         """Calculate the azimuth from the point to another Point."""
@@ -41,6 +46,18 @@ class PointBase:
         """Calculate the Euclidean distance from the point to another Point."""
         return calc_distance(self.xy, p.xy)
 
+    def distance_sq_to(self, p: PointBase) -> float:
+        """Calculate the squared Euclidean distance from the point to
+        another Point.
+
+        Avoids the square root when only relative distance is needed or
+        the caller applies its own square root.
+        """
+        dx = p.x - self.x
+        dy = p.y - self.y
+
+        return dx*dx + dy*dy
+
     def __repr__(self) -> str:
         """Return a string representation of the object."""
         return f'<{self.__class__.__name__} ({self.x}, {self.y})>'
@@ -59,6 +76,8 @@ class Circle(PointBase):
         Rotation direction. 1 for clockwise, -1 for counter-clockwise.
     """
 
+    __slots__ = ('s',)
+
     def __init__(self, x: float, y: float, s: int):
         """Instantiate a new Circle.
 
@@ -72,7 +91,7 @@ class Circle(PointBase):
             Direction of rotation about the circle.
             1 for clockwise, -1 for counter-clockwise.
         """
-        if s not in [-1, 1]:
+        if s not in (-1, 1):
             raise ValueError(f'"s" parameter must be in [-1, 1], got {s}')
 
         super().__init__(x, y)
@@ -101,6 +120,8 @@ class IntermediatePoint(PointBase):
         IntermediatePoint.
     """
 
+    __slots__ = ('crs', 'crs_norm', 'seg_length')
+
     def __init__(self, x: float, y: float, crs_norm: float, seg_length: float):
         """Instantiate a new Waypoint.
 
@@ -158,6 +179,8 @@ class Waypoint(PointBase):
         Course, in degrees, normalized to (-180, 180].
     """
 
+    __slots__ = ('crs', 'crs_norm', '_sin_crs', '_cos_crs')
+
     def __init__(self, x: float, y: float, crs: float):
         """Instantiate a new Waypoint.
 
@@ -173,6 +196,9 @@ class Waypoint(PointBase):
         super().__init__(x, y)
         self.crs = crs % 360.
         self.crs_norm = round(normalize_angle(self.crs), 2)
+        # Cached once: every circle construction that references this
+        # waypoint needs the sine/cosine of its normalized course.
+        self._sin_crs, self._cos_crs = sincos(self.crs_norm)
 
     def calc_beta(self, wpt: Waypoint) -> float:
         """Calculate the beta angle between the Waypoint and another Waypoint.
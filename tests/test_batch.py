@@ -0,0 +1,95 @@
+"""Tests for the batch path-construction interface in batch.py."""
+import numpy as np
+import pytest
+
+from dubins import DubinsCSC, Turn, Waypoint, create_paths_batch
+
+
+@pytest.mark.parametrize(
+    "turns",
+    [
+        [Turn.LEFT, Turn.LEFT],
+        [Turn.RIGHT, Turn.RIGHT],
+        [Turn.LEFT, Turn.RIGHT],
+        [Turn.RIGHT, Turn.LEFT],
+    ],
+)
+def test_create_paths_batch(turns: list[Turn]) -> None:
+    """Assert batch construction matches per-path DubinsCSC output.
+
+    Parameters
+    ----------
+    turns: list of Turn
+        Prescribed turns.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+    """
+    origins = np.array([
+        (0, 0, 45),
+        (10, 0, 60),
+        (-5, 12, 300),
+    ])
+    termini = np.array([
+        (40, 25, 120),
+        (-30, 14, 210),
+        (28, -18, 150),
+    ])
+    radius = 2
+
+    paths = create_paths_batch(
+        origins, termini, radius, turns, delta_psi=1, delta_d=0.5)
+
+    assert len(paths) == len(origins)
+
+    for origin, terminus, path in zip(origins, termini, paths):
+        dub = DubinsCSC(
+            Waypoint(*origin), Waypoint(*terminus), radius, turns)
+        expected = dub.create_path(delta_psi=1, delta_d=0.5)
+
+        assert path.shape == expected.shape
+        assert np.allclose(path, expected)
+
+
+def test_create_paths_batch_hemisphere() -> None:
+    """Assert hemisphere pairs are exempt from the feasibility check.
+
+    A hemisphere pair (orthogonal courses, exactly a turn diameter
+    apart) has overlapping circles under LSR/RSL turns; the batch
+    interface must still match the scalar DubinsCSC output rather than
+    raise.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+    """
+    origin = (0, 0, 0)
+    terminus = (4, 0, 90)
+    radius = 2
+    turns = [Turn.RIGHT, Turn.LEFT]
+
+    paths = create_paths_batch(
+        np.array([origin]), np.array([terminus]), radius, turns)
+
+    expected = DubinsCSC(
+        Waypoint(*origin), Waypoint(*terminus), radius, turns).create_path()
+
+    assert paths[0].shape == expected.shape
+    assert np.allclose(paths[0], expected)
+
+
+def test_create_paths_batch_bad_shape() -> None:
+    """Assert create_paths_batch() rejects mismatched input arrays."""
+    with pytest.raises(ValueError):
+        create_paths_batch(
+            np.zeros((3, 3)), np.zeros((2, 3)), 2,
+            [Turn.LEFT, Turn.LEFT])
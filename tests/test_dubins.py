@@ -1,5 +1,8 @@
 """Tests for classes in dubins.py."""
-from dubins import DubinsType, Turn
+import numpy as np
+import pytest
+
+from dubins import DubinsCSC, DubinsType, Turn, Waypoint
 
 
 def test_turn():
@@ -7,6 +10,44 @@ def test_turn():
     assert Turn.RIGHT.value == 1
     assert Turn.LEFT.value == -1
     assert Turn.reverse(Turn.LEFT) == Turn.RIGHT
+    assert -Turn.LEFT == Turn.RIGHT
+    assert -Turn.RIGHT == Turn.LEFT
+
+    with pytest.raises(TypeError):
+        Turn.reverse(1)
+
+
+def test_tangent_points():
+    """Test the cached tangent line endpoints of DubinsCSC.
+
+    The endpoints must span the tangent line (separation d, heading
+    theta) and coincide with the arc/line junctions of the sampled path
+    within one arc-sampling step.
+    """
+    dub = DubinsCSC(
+        Waypoint(0, 0, 45), Waypoint(40, 25, 120), 2,
+        [Turn.LEFT, Turn.LEFT])
+    p1, p2 = dub.tangent_points
+
+    assert np.hypot(p2[0] - p1[0], p2[1] - p1[1]) == pytest.approx(dub.d)
+
+    points = dub.create_path(delta_psi=1, delta_d=0.5)
+
+    # The sampled arcs may stop up to one delta_psi step short of the
+    # tangent heading.
+    tol = 2 * 2 * np.radians(1)
+    assert np.hypot(*(points - p1).T).min() < tol
+    assert np.hypot(*(points - p2).T).min() < tol
+
+
+def test_tangent_points_hemisphere():
+    """Test that the hemisphere case, which has no straight segment,
+    carries no tangent points."""
+    dub = DubinsCSC(
+        Waypoint(0, 0, 0), Waypoint(4, 0, 90), 2, [Turn.RIGHT, Turn.LEFT])
+
+    assert dub.d == -1
+    assert dub.tangent_points == (None, None)
 
 
 def test_dubins_type():
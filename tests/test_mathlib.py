@@ -1,7 +1,11 @@
 """Tests for functions in methlib.py"""
+import numpy as np
 import pytest
 
-from dubins.mathlib import azimuth_to_uangle, calc_azimuth, calc_fwd
+from dubins.mathlib import (
+    azimuth_to_uangle, calc_azimuth, calc_azimuth_batch, calc_distance,
+    calc_distance_batch, calc_fwd, calc_fwd_batch, cos, fast_cos_deg,
+    fast_sin_deg, sin, sincos)
 
 
 @pytest.mark.parametrize(
@@ -114,4 +118,113 @@ def test_calc_fwd(
     ------
     AssertionError
     """
-    assert calc_fwd(origin, azimuth, dist) == expected
+    assert calc_fwd(origin, azimuth, dist) == pytest.approx(expected)
+
+
+def test_calc_distance_batch() -> None:
+    """Assert calc_distance_batch() matches the scalar calc_distance.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+    """
+    points1 = np.array([[0., 0.], [2., 2.], [-3., 4.]])
+    points2 = np.array([[3., 4.], [2., 2.], [0., 0.]])
+
+    expected = [
+        calc_distance(p1, p2) for p1, p2 in zip(points1, points2)]
+
+    assert np.allclose(calc_distance_batch(points1, points2), expected)
+
+
+def test_calc_fwd_batch() -> None:
+    """Assert calc_fwd_batch() matches the scalar calc_fwd.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+    """
+    origins = np.array([[0., 0.], [2., 2.], [-3., 4.]])
+    azimuths = np.array([0., 90., 215.])
+    dists = np.array([5., 10., 2.5])
+
+    expected = [
+        calc_fwd(tuple(o), azi, dist)
+        for o, azi, dist in zip(origins, azimuths, dists)]
+
+    assert np.allclose(calc_fwd_batch(origins, azimuths, dists), expected)
+
+
+def test_calc_azimuth_batch() -> None:
+    """Assert calc_azimuth_batch() matches the scalar calc_azimuth.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+    """
+    points1 = np.array([[0., 0.], [2., 2.], [-3., 4.]])
+    points2 = np.array([[3., 4.], [2., 5.], [0., 0.]])
+
+    expected = [
+        calc_azimuth(p1, p2) for p1, p2 in zip(points1, points2)]
+
+    assert np.allclose(calc_azimuth_batch(points1, points2), expected)
+
+
+@pytest.mark.parametrize("angle", [0, 30, 45, 90, 135, 180, 270, 330])
+def test_sincos(angle: float) -> None:
+    """Assert sincos() matches the individual sin and cos helpers.
+
+    Parameters
+    ----------
+    angle: float
+        Angle, in degrees.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+    """
+    s, c = sincos(angle)
+
+    assert s == sin(angle)
+    assert c == cos(angle)
+
+
+@pytest.mark.parametrize(
+    "angle",
+    [0, 0.05, 30, 45.3, 90, 135, 180, 269.99, 330, -42.5, -1e-16, 360.,
+     359.99999, -360.])
+def test_fast_trig(angle: float) -> None:
+    """Assert the table-lookup trig helpers track sin and cos.
+
+    Parameters
+    ----------
+    angle: float
+        Angle, in degrees.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+    """
+    assert fast_sin_deg(angle) == pytest.approx(sin(angle), abs=4e-7)
+    assert fast_cos_deg(angle) == pytest.approx(cos(angle), abs=4e-7)
@@ -0,0 +1,38 @@
+"""Tests for the PathArray container."""
+import numpy as np
+
+from dubins import DubinsCSC, Turn, Waypoint
+from dubins.point import IntermediatePoint
+
+
+def test_create_path_array():
+    """Assert create_path_array() mirrors create_path() and carries
+    one heading per point."""
+    origin = Waypoint(10, 0, 60)
+    terminus = Waypoint(0, 4, 120)
+    turns = [Turn.RIGHT, Turn.LEFT]
+
+    points = DubinsCSC(origin, terminus, 4, turns).create_path()
+    path = DubinsCSC(origin, terminus, 4, turns).create_path_array()
+
+    assert len(path) == len(points)
+    assert len(path.psis) == len(points)
+    assert np.array_equal(path.points, points)
+    assert np.array_equal(path.x, points[:, 0])
+    assert np.array_equal(path.y, points[:, 1])
+
+
+def test_path_array_to_intermediate_points():
+    """Assert IntermediatePoint materialization preserves coordinates
+    and segment lengths."""
+    origin = Waypoint(10, 0, 60)
+    terminus = Waypoint(0, 4, 120)
+
+    path = DubinsCSC(
+        origin, terminus, 4, [Turn.RIGHT, Turn.LEFT]).create_path_array()
+    points = path.to_intermediate_points()
+
+    assert len(points) == len(path)
+    assert all(isinstance(p, IntermediatePoint) for p in points)
+    assert points[0].seg_length == 0
+    assert points[0].xy == (path.points[0][0], path.points[0][1])
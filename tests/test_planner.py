@@ -0,0 +1,53 @@
+"""Tests for the path-planning helpers in planner.py."""
+import pytest
+
+from dubins import DubinsCSC, DubinsLoopback, Turn, Waypoint
+from dubins.planner import get_dubins
+
+
+@pytest.mark.parametrize(
+    "terminus, turns, expected",
+    [
+        # Orthogonal pairs straddling the 2 * radius boundary. The CSC
+        # side uses RSR turns; RSL circles overlap at these distances.
+        (Waypoint(3.99, 0, 90), [Turn.RIGHT, Turn.LEFT], DubinsLoopback),
+        (Waypoint(3.996, 0, 90), [Turn.RIGHT, Turn.RIGHT], DubinsCSC),
+        (Waypoint(4.5, 0, 90), [Turn.RIGHT, Turn.RIGHT], DubinsCSC),
+        # Non-orthogonal pairs on either side of the cross-track boundary.
+        (Waypoint(1, 0.5, 180), [Turn.RIGHT, Turn.LEFT], DubinsLoopback),
+        (Waypoint(20, 10, 180), [Turn.RIGHT, Turn.LEFT], DubinsCSC),
+    ],
+)
+def test_get_dubins_classification(
+    terminus: Waypoint,
+    turns: list[Turn],
+    expected: type,
+) -> None:
+    """Assert get_dubins() selects the class the distance boundary
+    prescribes.
+
+    The boundary sits half a 0.01 quantum below 2 * radius, matching
+    the round(..., 2) comparisons it replaced.
+
+    Parameters
+    ----------
+    terminus: Waypoint
+        Fly-to Point defining the end of the Dubins path.
+    turns: list of Turn
+        Prescribed turns.
+    expected: type
+        Dubins class get_dubins() is expected to return.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+    """
+    origin = Waypoint(0, 0, 0)
+
+    d = get_dubins(origin, terminus, 2, turns)
+
+    assert isinstance(d, expected)
@@ -20,6 +20,12 @@ def test_waypoint():
     assert wpt.crs_norm == -30
 
 
+def test_point_slots():
+    """Assert the point classes carry no per-instance __dict__."""
+    assert not hasattr(Circle(4, 5, -1), '__dict__')
+    assert not hasattr(Waypoint(4, 5, 330), '__dict__')
+
+
 def test_waypoint_distance():
     """Assert Waypoint.distance() returns the correct distance."""
     wpt = Waypoint(2, 2, 330)
@@ -28,6 +34,14 @@ def test_waypoint_distance():
     assert round(wpt.distance_to(wpt2), 2) == 7.21
 
 
+def test_waypoint_distance_sq():
+    """Assert Waypoint.distance_sq_to() returns the squared distance."""
+    wpt = Waypoint(2, 2, 330)
+    wpt2 = Waypoint(6, 8, 120)
+
+    assert wpt.distance_sq_to(wpt2) == 52
+
+
 @pytest.mark.parametrize(
     "wpt1, wpt2, expected",
     [